@@ -956,7 +956,12 @@ class Manager(QtCore.QObject):
             module.setStatusVariables(self.loadStatusVariables(base, name))
             # start main loop for qt objects
             if module.is_module_threaded:
-                modthread = self.tm.newThread('mod-{0}-{1}'.format(base, name))
+                # a finished thread of this module may not have been cleaned up yet
+                modthread = self.tm.newThread('mod-{0}-{1}'.format(base, name), replace=True)
+                if modthread is None:
+                    logger.error('{0} module {1}: thread mod-{0}-{1} is still running, '
+                                 'can not activate module.'.format(base, name))
+                    return
                 module.moveToThread(modthread)
                 modthread.start()
                 success = QtCore.QMetaObject.invokeMethod(
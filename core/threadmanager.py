@@ -21,49 +21,112 @@ top-level directory of this distribution and at <https://github.com/Ulm-IQO/qudi
 
 
 import logging
+import operator
 logger = logging.getLogger(__name__)
 from qtpy import QtCore
-from collections import OrderedDict
-from .util.mutex import Mutex
+
+# Qt enum values used by the table model methods, resolved once instead of on every call
+_DISPLAY_ROLE = QtCore.Qt.DisplayRole
+_HORIZONTAL = QtCore.Qt.Horizontal
+_ITEM_FLAGS = QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
 
 
 class ThreadManager(QtCore.QAbstractTableModel):
     """ This class keeps track of all the QThreads that are needed somewhere.
     """
+    # ThreadItem attribute displayed in each table column
+    _column_getters = (operator.attrgetter('name'), operator.attrgetter('thread'))
+
     def __init__(self):
         super().__init__()
-        self._threads = OrderedDict()
-        self.lock = Mutex()
+        # name -> ThreadItem for O(1) lookup, ThreadItems in row order for the table model
+        self._threads = dict()
+        self._items = list()
+        # Adding and removing threads is serialized by the (non-recursive) write mutex. The dict
+        # and list themselves are only changed under the write lock, and plain lookups take it
+        # for reading. The row notifications are emitted outside the write lock, so slots
+        # connected to them can still call getThreadByName. The table model methods (rowCount,
+        # data) stay lock-free.
+        self._write_mutex = QtCore.QMutex()
+        self.lock = QtCore.QReadWriteLock()
+        # one-slot cache of the most recently looked up ThreadItem
+        self._last_item = None
         self.headers = ['Name', 'Thread']
         self.thread = QtCore.QThread.currentThread()
 
-    def newThread(self, name):
+    def newThread(self, name, replace=False):
         """ Create a new thread with a name, return its object
           @param str name: unique name of thread
+          @param bool replace: optional, replace a thread of the same name that is not running
+                               anymore instead of failing
 
           @return QThread: new thred, none if failed
         """
-        logger.debug('Creating thread: \"{0}\".'.format(name))
-        with self.lock:
-            if 'name' in self._threads:
+        logger.debug('Creating thread: "%s".', name)
+        with QtCore.QMutexLocker(self._write_mutex):
+            old_item = self._threads.get(name)
+            if old_item is not None and (not replace or old_item.thread.isRunning()):
+                return None
+            item = ThreadItem(name)
+            item.sigThreadHasQuit.connect(self.cleanupThread, QtCore.Qt.QueuedConnection)
+            if old_item is None:
+                row = len(self._items)
+                self.beginInsertRows(QtCore.QModelIndex(), row, row)
+                with QtCore.QWriteLocker(self.lock):
+                    self._threads[name] = item
+                    self._items.append(item)
+                self.endInsertRows()
+                return item.thread
+            # The row itself stays where it is, only its content changes.
+            self._disconnect_item(old_item)
+            row = self.getItemNumberByKey(name)
+            with QtCore.QWriteLocker(self.lock):
+                if self._last_item is old_item:
+                    self._last_item = None
+                self._threads[name] = item
+                self._items[row] = item
+            self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+        return item.thread
+
+    def newThreads(self, names):
+        """ Create several new threads at once, return their objects.
+        The threads are added in a single model insertion, so views are only notified once.
+
+          @param list names: unique names of the threads
+
+          @return list: new QThreads in the order of names, none if any of the names is taken
+        """
+        names = list(names)
+        if len(set(names)) != len(names):
+            return None
+        logger.debug('Creating threads: %s.', names)
+        with QtCore.QMutexLocker(self._write_mutex):
+            if any(name in self._threads for name in names):
                 return None
-            row = len(self._threads)
-            self.beginInsertRows(QtCore.QModelIndex(), row, row)
-            self._threads[name] = ThreadItem(name)
-            self._threads[name].sigThreadHasQuit.connect(self.cleanupThread, QtCore.Qt.QueuedConnection)
+            if not names:
+                return list()
+            items = [ThreadItem(name) for name in names]
+            for item in items:
+                item.sigThreadHasQuit.connect(self.cleanupThread, QtCore.Qt.QueuedConnection)
+            row = len(self._items)
+            self.beginInsertRows(QtCore.QModelIndex(), row, row + len(items) - 1)
+            with QtCore.QWriteLocker(self.lock):
+                self._threads.update(zip(names, items))
+                self._items.extend(items)
             self.endInsertRows()
-        return self._threads[name].thread
+        return [item.thread for item in items]
 
     def quitThread(self, name):
         """Stop event loop of QThread.
 
           @param str name: unique thread name
         """
-        if name in self._threads:
-            logger.debug('Quitting thread {0}.'.format(name))
-            self._threads[name].thread.quit()
+        item = self._get_item(name)
+        if item is not None:
+            logger.debug('Quitting thread %s.', name)
+            item.thread.quit()
         else:
-            logger.debug('You tried quitting a nonexistent thread {0}.'.format(name))
+            logger.debug('You tried quitting a nonexistent thread %s.', name)
 
     def joinThread(self, name, time=None):
         """Stop event loop of QThread.
@@ -71,34 +134,96 @@ class ThreadManager(QtCore.QAbstractTableModel):
           @param str name: unique thread name
           @param int time: timeout for waiting in msec
         """
-        if name in self._threads:
-            logger.debug('Waiting for thread {0} to end.'.format(name))
+        item = self._get_item(name)
+        if item is not None:
+            logger.debug('Waiting for thread %s to end.', name)
             if time is None:
-                self._threads[name].thread.wait()
+                item.thread.wait()
             else:
-                self._threads[name].thread.wait(time)
+                item.thread.wait(time)
         else:
-            logger.debug('You tried waiting for a nonexistent thread {0}.'.format(name))
+            logger.debug('You tried waiting for a nonexistent thread %s.', name)
 
     def cleanupThread(self, name):
         """Remove thread from thread list.
 
           @param str name: unique thread name
         """
-        if name in self._threads and not self._threads[name].thread.isRunning():
-            logger.debug('Cleaning up thread {0}.'.format(name))
-            with self.lock:
-                row = self.getItemNumberByKey(name)
-                self.beginRemoveRows(QtCore.QModelIndex(), row, row)
-                self._threads.pop(name)
-                self.endRemoveRows()
+        with QtCore.QMutexLocker(self._write_mutex):
+            # Look the entry up only once writers are excluded, so it can not be replaced between
+            # the check and the removal.
+            item = self._threads.get(name)
+            if item is None or item.thread.isRunning():
+                return
+            logger.debug('Cleaning up thread %s.', name)
+            row = self._items.index(item)
+            self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+            with QtCore.QWriteLocker(self.lock):
+                if self._last_item is item:
+                    self._last_item = None
+                del self._threads[name]
+                del self._items[row]
+            self.endRemoveRows()
+        self._disconnect_item(item)
+
+    def _disconnect_item(self, item):
+        """ Detach a ThreadItem that is no longer registered from the thread manager.
+        Should its QThread be restarted by someone holding a reference, the finished signal must
+        not trigger another cleanup of a thread that is no longer registered.
+
+          @param ThreadItem item: removed or replaced thread item
+        """
+        item.thread.finished.disconnect(item.myThreadHasQuit)
+        item.sigThreadHasQuit.disconnect(self.cleanupThread)
 
-    def quitAllThreads(self):
+    def quitAllThreads(self, time=None):
         """Stop event loop of all QThreads.
+
+          @param int time: optional, timeout in msec to wait for each thread to end after all
+                           threads have been asked to quit. Does not wait if None.
         """
         logger.debug('Quit all threads.')
-        for name in self._threads:
-            self._threads[name].thread.quit()
+        with QtCore.QReadLocker(self.lock):
+            items = list(self._threads.values())
+        # Ask all threads to quit first so they can shut down in parallel, then join them.
+        for item in items:
+            item.thread.quit()
+        if time is not None:
+            for item in items:
+                item.thread.wait(time)
+
+    def getThreadByName(self, name):
+        """ Get a registered thread by its name.
+
+            @param str name: unique thread name
+
+            @return QThread: the thread registered under name, None if there is no such thread
+        """
+        item = self._get_item(name)
+        return None if item is None else item.thread
+
+    def _get_item(self, name):
+        """ Look up the ThreadItem for a thread name.
+        Repeated lookups of the same name (e.g. quitThread followed by joinThread) are served
+        from a one-slot cache, and unknown names are rejected, without taking the lock.
+
+            @param str name: unique thread name
+
+            @return ThreadItem: the item registered under name, None if not found
+        """
+        item = self._last_item
+        if item is not None and item.name == name:
+            return item
+        # Unknown names (e.g. quitting an already cleaned up thread) are common. A single dict
+        # probe is atomic under the GIL, so misses are answered without touching the lock.
+        if name not in self._threads:
+            return None
+        with QtCore.QReadLocker(self.lock):
+            item = self._threads.get(name)
+            # populate the cache under the lock so a concurrent cleanupThread can not be undone
+            if item is not None:
+                self._last_item = item
+        return item
 
     def getItemByNumber(self, n):
         """ Get thread by number ins list.
@@ -107,15 +232,10 @@ class ThreadManager(QtCore.QAbstractTableModel):
 
             @return (threadname, thread): thread name and thread
         """
-        i = 0
-        if not(0 <= n < len(self._threads)):
+        if not(0 <= n < len(self._items)):
             raise IndexError
-        it = iter(self._threads)
-        key = next(it)
-        while i<n:
-            key = next(it)
-            i += 1
-        return key, self._threads[key]
+        item = self._items[n]
+        return item.name, item
 
     def getItemNumberByKey(self, key):
         """ Get number in list from thread name.
@@ -124,20 +244,14 @@ class ThreadManager(QtCore.QAbstractTableModel):
 
             @return int: thread number in list
         """
-        i = 0
-        it = iter(self._threads)
-        newkey = next(it)
-        while key != newkey:
-            newkey = next(it)
-            i += 1
-        return i
+        return self._items.index(self._threads[key])
 
     def rowCount(self, parent = QtCore.QModelIndex()):
         """ Gives the number of threads registered.
 
           @return int: number of threads
         """
-        return len(self._threads)
+        return len(self._items)
 
     def columnCount(self, parent = QtCore.QModelIndex()):
         """ Gives the number of data fields of a thread.
@@ -153,7 +267,7 @@ class ThreadManager(QtCore.QAbstractTableModel):
 
           @return Qt.ItemFlags: actins allowed fotr this cell
         """
-        return QtCore.Qt.ItemIsEnabled |  QtCore.Qt.ItemIsSelectable
+        return _ITEM_FLAGS
 
     def data(self, index,  role):
         """ Get data from model for a given cell. Data can have a role that affects display.
@@ -163,18 +277,14 @@ class ThreadManager(QtCore.QAbstractTableModel):
 
           @return QVariant: data for given cell and role
         """
-        if not index.isValid():
+        if role != _DISPLAY_ROLE or not index.isValid():
             return None
-        elif role == QtCore.Qt.DisplayRole:
-            item = self.getItemByNumber(index.row())
-            if index.column() == 0:
-               return item[1].name
-            elif index.column() == 1:
-                return item[1].thread
-            else:
-                return None
-        else:
+        try:
+            getter = self._column_getters[index.column()]
+            item = self._items[index.row()]
+        except IndexError:
             return None
+        return getter(item)
 
     def headerData(self, section, orientation, role = QtCore.Qt.DisplayRole):
         """ Data for the table view headers.
@@ -187,9 +297,9 @@ class ThreadManager(QtCore.QAbstractTableModel):
         """
         if not(0 <= section <= 1):
             return None
-        elif role != QtCore.Qt.DisplayRole:
+        elif role != _DISPLAY_ROLE:
             return None
-        elif orientation != QtCore.Qt.Horizontal:
+        elif orientation != _HORIZONTAL:
             return None
         else:
             return self.headers[section]
@@ -217,6 +327,6 @@ class ThreadItem(QtCore.QObject):
             Re-emits signal containing the unique thread name.
         """
         self.sigThreadHasQuit.emit(self.name)
-        logger.debug('Thread {0} has quit.'.format(self.name))
+        logger.debug('Thread %s has quit.', self.name)
 
 
@@ -280,6 +280,10 @@ def in_range(value, lower_limit, upper_limit):
     return value
 
 
+# translation table deleting square, round and curly brackets in a single pass
+_CSV_BRACKET_TABLE = str.maketrans('', '', '[](){}')
+
+
 def csv_2_list(csv_string, str_2_val=None):
     """
     Parse a list literal (with or without square brackets) given as string containing
@@ -296,9 +300,7 @@ def csv_2_list(csv_string, str_2_val=None):
     if not isinstance(csv_string, str):
         raise TypeError('string_2_list accepts only str type input.')
 
-    csv_string = csv_string.replace('[', '').replace(']', '')  # Remove square brackets
-    csv_string = csv_string.replace('(', '').replace(')', '')  # Remove round brackets
-    csv_string = csv_string.replace('{', '').replace('}', '')  # Remove curly brackets
+    csv_string = csv_string.translate(_CSV_BRACKET_TABLE)  # Remove all kinds of brackets
     csv_string = csv_string.strip().strip(',')  # Remove trailing/leading blanks and commas
 
     # Cast each str value to float if no explicit cast function is given by parameter str_2_val.
@@ -76,6 +76,9 @@ class Mutex(QtCore.QMutex):
 
             @param id: debug id
         """
+        # uncontended or recursive re-entry: a single non-blocking attempt is enough
+        if not self.debug and QtCore.QMutex.tryLock(self):
+            return
         c = 0
         wait_time = 5000  # in ms
         while True:
@@ -45,7 +45,7 @@ class GenericLogic(Base):
 
           @return QThread: thread with qt event loop associated with this module
         """
-        return self._manager.tm._threads['mod-logic-' + self._name].thread
+        return self._manager.tm.getThreadByName('mod-logic-' + self._name)
 
     def getTaskRunner(self):
         """ Get a reference to the task runner module registered in the manager.
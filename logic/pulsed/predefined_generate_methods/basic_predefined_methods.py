@@ -212,10 +212,7 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
 
         # Create block and append to created_blocks list
         rabi_block = PulseBlock(name=name)
-        rabi_block.append(mw_element)
-        rabi_block.append(laser_element)
-        rabi_block.append(delay_element)
-        rabi_block.append(waiting_element)
+        rabi_block.extend((mw_element, laser_element, delay_element, waiting_element))
         created_blocks.append(rabi_block)
 
         # Create block ensemble
@@ -226,14 +223,13 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
         self._add_trigger(created_blocks=created_blocks, block_ensemble=block_ensemble)
 
         # add metadata to invoke settings later on
-        block_ensemble.measurement_information['alternating'] = False
-        block_ensemble.measurement_information['laser_ignore_list'] = list()
-        block_ensemble.measurement_information['controlled_variable'] = tau_array
-        block_ensemble.measurement_information['units'] = ('s', '')
-        block_ensemble.measurement_information['labels'] = ('Tau<sub>pulse spacing</sub>', 'Signal')
-        block_ensemble.measurement_information['number_of_lasers'] = num_of_points
-        block_ensemble.measurement_information['counting_length'] = self._get_ensemble_count_length(
-            ensemble=block_ensemble, created_blocks=created_blocks)
+        self._add_metadata_to_settings(block_ensemble,
+                                       created_blocks=created_blocks,
+                                       alternating=False,
+                                       controlled_variable=tau_array,
+                                       units=('s', ''),
+                                       labels=('Tau<sub>pulse spacing</sub>', 'Signal'),
+                                       number_of_lasers=num_of_points)
 
         # Append ensemble to created_ensembles list
         created_ensembles.append(block_ensemble)
@@ -258,18 +254,20 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
                                                      increment=0)
         delay_element = self._get_delay_gate_element()
 
-        # Create block and append to created_blocks list
-        pulsedodmr_block = PulseBlock(name=name)
+        pi_length = self.rabi_period / 2
+        mw_amp = self.microwave_amplitude
+
+        block_elements = list()
         for mw_freq in freq_array:
-            mw_element = self._get_mw_element(length=self.rabi_period / 2,
+            mw_element = self._get_mw_element(length=pi_length,
                                               increment=0,
-                                              amp=self.microwave_amplitude,
+                                              amp=mw_amp,
                                               freq=mw_freq,
                                               phase=0)
-            pulsedodmr_block.append(mw_element)
-            pulsedodmr_block.append(laser_element)
-            pulsedodmr_block.append(delay_element)
-            pulsedodmr_block.append(waiting_element)
+            block_elements.extend((mw_element, laser_element, delay_element, waiting_element))
+        # Create block and append to created_blocks list
+        pulsedodmr_block = PulseBlock(name=name)
+        pulsedodmr_block.extend(block_elements)
         created_blocks.append(pulsedodmr_block)
 
         # Create block ensemble
@@ -280,14 +278,13 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
         self._add_trigger(created_blocks=created_blocks, block_ensemble=block_ensemble)
 
         # add metadata to invoke settings later on
-        block_ensemble.measurement_information['alternating'] = False
-        block_ensemble.measurement_information['laser_ignore_list'] = list()
-        block_ensemble.measurement_information['controlled_variable'] = freq_array
-        block_ensemble.measurement_information['units'] = ('Hz', '')
-        block_ensemble.measurement_information['labels'] = ('Frequency', 'Signal')
-        block_ensemble.measurement_information['number_of_lasers'] = num_of_points
-        block_ensemble.measurement_information['counting_length'] = self._get_ensemble_count_length(
-            ensemble=block_ensemble, created_blocks=created_blocks)
+        self._add_metadata_to_settings(block_ensemble,
+                                       created_blocks=created_blocks,
+                                       alternating=False,
+                                       controlled_variable=freq_array,
+                                       units=('Hz', ''),
+                                       labels=('Frequency', 'Signal'),
+                                       number_of_lasers=num_of_points)
 
         # append ensemble to created ensembles
         created_ensembles.append(block_ensemble)
@@ -317,36 +314,17 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
                                               amp=self.microwave_amplitude,
                                               freq=self.microwave_frequency,
                                               phase=0)
-        # Use a 180 deg phase shiftet pulse as 3pihalf pulse if microwave channel is analog
-        if self.microwave_channel.startswith('a'):
-            pi3half_element = self._get_mw_element(length=self.rabi_period / 4,
-                                                   increment=0,
-                                                   amp=self.microwave_amplitude,
-                                                   freq=self.microwave_frequency,
-                                                   phase=180)
-        else:
-            pi3half_element = self._get_mw_element(length=3 * self.rabi_period / 4,
-                                                   increment=0,
-                                                   amp=self.microwave_amplitude,
-                                                   freq=self.microwave_frequency,
-                                                   phase=0)
+        pi3half_element = self._get_pi3half_element()
         tau_element = self._get_idle_element(length=tau_pspacing_start, increment=tau_step)
 
+        block_elements = [pihalf_element, tau_element, pihalf_element, laser_element,
+                          delay_element, waiting_element]
+        if alternating:
+            block_elements.extend((pihalf_element, tau_element, pi3half_element, laser_element,
+                                   delay_element, waiting_element))
         # Create block and append to created_blocks list
         ramsey_block = PulseBlock(name=name)
-        ramsey_block.append(pihalf_element)
-        ramsey_block.append(tau_element)
-        ramsey_block.append(pihalf_element)
-        ramsey_block.append(laser_element)
-        ramsey_block.append(delay_element)
-        ramsey_block.append(waiting_element)
-        if alternating:
-            ramsey_block.append(pihalf_element)
-            ramsey_block.append(tau_element)
-            ramsey_block.append(pi3half_element)
-            ramsey_block.append(laser_element)
-            ramsey_block.append(delay_element)
-            ramsey_block.append(waiting_element)
+        ramsey_block.extend(block_elements)
         created_blocks.append(ramsey_block)
 
         # Create block ensemble
@@ -358,14 +336,13 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
 
         # add metadata to invoke settings later on
         number_of_lasers = 2 * num_of_points if alternating else num_of_points
-        block_ensemble.measurement_information['alternating'] = alternating
-        block_ensemble.measurement_information['laser_ignore_list'] = list()
-        block_ensemble.measurement_information['controlled_variable'] = tau_array
-        block_ensemble.measurement_information['units'] = ('s', '')
-        block_ensemble.measurement_information['labels'] = ('Tau', 'Signal')
-        block_ensemble.measurement_information['number_of_lasers'] = number_of_lasers
-        block_ensemble.measurement_information['counting_length'] = self._get_ensemble_count_length(
-            ensemble=block_ensemble, created_blocks=created_blocks)
+        self._add_metadata_to_settings(block_ensemble,
+                                       created_blocks=created_blocks,
+                                       alternating=alternating,
+                                       controlled_variable=tau_array,
+                                       units=('s', ''),
+                                       labels=('Tau', 'Signal'),
+                                       number_of_lasers=number_of_lasers)
 
         # append ensemble to created ensembles
         created_ensembles.append(block_ensemble)
@@ -398,39 +375,21 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
                                               phase=0)
 
         if alternating:
-            if self.microwave_channel.startswith('a'):
-                pi3half_element = self._get_mw_element(length=self.rabi_period / 4,
-                                                       increment=0,
-                                                       amp=self.microwave_amplitude,
-                                                       freq=self.microwave_frequency,
-                                                       phase=180)
-            else:
-                pi3half_element = self._get_mw_element(length=3 * self.rabi_period / 4,
-                                                       increment=0,
-                                                       amp=self.microwave_amplitude,
-                                                       freq=self.microwave_frequency,
-                                                       phase=0)
+            pi3half_element = self._get_pi3half_element()
 
-        # Create block and append to created_blocks list
-        ramsey_block = PulseBlock(name=name)
+        block_elements = list()
         for tau_pspacing in tau_pspacing_array:
             tau_element = self._get_idle_element(length=tau_pspacing, increment=0)
-            ramsey_block.append(pihalf_element)
-            ramsey_block.append(tau_element)
-            ramsey_block.append(tau_element)
-            ramsey_block.append(pihalf_element)
-            ramsey_block.append(laser_element)
-            ramsey_block.append(delay_element)
-            ramsey_block.append(waiting_element)
+            block_elements.extend((pihalf_element, tau_element, tau_element, pihalf_element,
+                                   laser_element, delay_element, waiting_element))
 
             if alternating:
-                ramsey_block.append(pihalf_element)
-                ramsey_block.append(tau_element)
-                ramsey_block.append(pi3half_element)
-                ramsey_block.append(laser_element)
-                ramsey_block.append(delay_element)
-                ramsey_block.append(waiting_element)
+                block_elements.extend((pihalf_element, tau_element, pi3half_element, laser_element,
+                                       delay_element, waiting_element))
 
+        # Create block and append to created_blocks list
+        ramsey_block = PulseBlock(name=name)
+        ramsey_block.extend(block_elements)
         created_blocks.append(ramsey_block)
 
         # Create block ensemble
@@ -442,14 +401,13 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
 
         # add metadata to invoke settings later on
         number_of_lasers = 2 * len(tau_array) if alternating else len(tau_array)
-        block_ensemble.measurement_information['alternating'] = alternating
-        block_ensemble.measurement_information['laser_ignore_list'] = list()
-        block_ensemble.measurement_information['controlled_variable'] = tau_array
-        block_ensemble.measurement_information['units'] = ('s', '')
-        block_ensemble.measurement_information['labels'] = ('Tau', 'Signal')
-        block_ensemble.measurement_information['number_of_lasers'] = number_of_lasers
-        block_ensemble.measurement_information['counting_length'] = self._get_ensemble_count_length(
-            ensemble=block_ensemble, created_blocks=created_blocks)
+        self._add_metadata_to_settings(block_ensemble,
+                                       created_blocks=created_blocks,
+                                       alternating=alternating,
+                                       controlled_variable=tau_array,
+                                       units=('s', ''),
+                                       labels=('Tau', 'Signal'),
+                                       number_of_lasers=number_of_lasers)
         # append ensemble to created ensembles
         created_ensembles.append(block_ensemble)
         return created_blocks, created_ensembles, created_sequences
@@ -483,40 +441,17 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
                                           amp=self.microwave_amplitude,
                                           freq=self.microwave_frequency,
                                           phase=0)
-        # Use a 180 deg phase shiftet pulse as 3pihalf pulse if microwave channel is analog
-        if self.microwave_channel.startswith('a'):
-            pi3half_element = self._get_mw_element(length=self.rabi_period / 4,
-                                                   increment=0,
-                                                   amp=self.microwave_amplitude,
-                                                   freq=self.microwave_frequency,
-                                                   phase=180)
-        else:
-            pi3half_element = self._get_mw_element(length=3 * self.rabi_period / 4,
-                                                   increment=0,
-                                                   amp=self.microwave_amplitude,
-                                                   freq=self.microwave_frequency,
-                                                   phase=0)
+        pi3half_element = self._get_pi3half_element()
         tau_element = self._get_idle_element(length=tau_pspacing_start, increment=tau_step)
 
+        block_elements = [pihalf_element, tau_element, pi_element, tau_element, pihalf_element,
+                          laser_element, delay_element, waiting_element]
+        if alternating:
+            block_elements.extend((pihalf_element, tau_element, pi_element, tau_element,
+                                   pi3half_element, laser_element, delay_element, waiting_element))
         # Create block and append to created_blocks list
         hahn_block = PulseBlock(name=name)
-        hahn_block.append(pihalf_element)
-        hahn_block.append(tau_element)
-        hahn_block.append(pi_element)
-        hahn_block.append(tau_element)
-        hahn_block.append(pihalf_element)
-        hahn_block.append(laser_element)
-        hahn_block.append(delay_element)
-        hahn_block.append(waiting_element)
-        if alternating:
-            hahn_block.append(pihalf_element)
-            hahn_block.append(tau_element)
-            hahn_block.append(pi_element)
-            hahn_block.append(tau_element)
-            hahn_block.append(pi3half_element)
-            hahn_block.append(laser_element)
-            hahn_block.append(delay_element)
-            hahn_block.append(waiting_element)
+        hahn_block.extend(block_elements)
         created_blocks.append(hahn_block)
 
         # Create block ensemble
@@ -528,14 +463,13 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
 
         # add metadata to invoke settings later on
         number_of_lasers = 2 * num_of_points if alternating else num_of_points
-        block_ensemble.measurement_information['alternating'] = alternating
-        block_ensemble.measurement_information['laser_ignore_list'] = list()
-        block_ensemble.measurement_information['controlled_variable'] = tau_array
-        block_ensemble.measurement_information['units'] = ('s', '')
-        block_ensemble.measurement_information['labels'] = ('Tau', 'Signal')
-        block_ensemble.measurement_information['number_of_lasers'] = number_of_lasers
-        block_ensemble.measurement_information['counting_length'] = self._get_ensemble_count_length(
-            ensemble=block_ensemble, created_blocks=created_blocks)
+        self._add_metadata_to_settings(block_ensemble,
+                                       created_blocks=created_blocks,
+                                       alternating=alternating,
+                                       controlled_variable=tau_array,
+                                       units=('s', ''),
+                                       labels=('Tau', 'Signal'),
+                                       number_of_lasers=number_of_lasers)
 
         # append ensemble to created ensembles
         created_ensembles.append(block_ensemble)
@@ -575,41 +509,20 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
                                           amp=self.microwave_amplitude,
                                           freq=self.microwave_frequency,
                                           phase=0)
-        # Use a 180 deg phase shiftet pulse as 3pihalf pulse if microwave channel is analog
-        if self.microwave_channel.startswith('a'):
-            pi3half_element = self._get_mw_element(length=self.rabi_period / 4,
-                                                   increment=0,
-                                                   amp=self.microwave_amplitude,
-                                                   freq=self.microwave_frequency,
-                                                   phase=180)
-        else:
-            pi3half_element = self._get_mw_element(length=3 * self.rabi_period / 4,
-                                                   increment=0,
-                                                   amp=self.microwave_amplitude,
-                                                   freq=self.microwave_frequency,
-                                                   phase=0)
+        pi3half_element = self._get_pi3half_element()
 
-        # Create block and append to created_blocks list
-        hahn_block = PulseBlock(name=name)
+        block_elements = list()
         for tau_pspacing in tau_pspacing_array:
             tau_element = self._get_idle_element(length=tau_pspacing, increment=0.0)
-            hahn_block.append(pihalf_element)
-            hahn_block.append(tau_element)
-            hahn_block.append(pi_element)
-            hahn_block.append(tau_element)
-            hahn_block.append(pihalf_element)
-            hahn_block.append(laser_element)
-            hahn_block.append(delay_element)
-            hahn_block.append(waiting_element)
+            block_elements.extend((pihalf_element, tau_element, pi_element, tau_element,
+                                   pihalf_element, laser_element, delay_element, waiting_element))
             if alternating:
-                hahn_block.append(pihalf_element)
-                hahn_block.append(tau_element)
-                hahn_block.append(pi_element)
-                hahn_block.append(tau_element)
-                hahn_block.append(pi3half_element)
-                hahn_block.append(laser_element)
-                hahn_block.append(delay_element)
-                hahn_block.append(waiting_element)
+                block_elements.extend((pihalf_element, tau_element, pi_element, tau_element,
+                                       pi3half_element, laser_element, delay_element,
+                                       waiting_element))
+        # Create block and append to created_blocks list
+        hahn_block = PulseBlock(name=name)
+        hahn_block.extend(block_elements)
         created_blocks.append(hahn_block)
 
         # Create block ensemble
@@ -621,14 +534,13 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
 
         # add metadata to invoke settings later on
         number_of_lasers = 2 * num_of_points if alternating else num_of_points
-        block_ensemble.measurement_information['alternating'] = alternating
-        block_ensemble.measurement_information['laser_ignore_list'] = list()
-        block_ensemble.measurement_information['controlled_variable'] = tau_array
-        block_ensemble.measurement_information['units'] = ('s', '')
-        block_ensemble.measurement_information['labels'] = ('Tau', 'Signal')
-        block_ensemble.measurement_information['number_of_lasers'] = number_of_lasers
-        block_ensemble.measurement_information['counting_length'] = self._get_ensemble_count_length(
-            ensemble=block_ensemble, created_blocks=created_blocks)
+        self._add_metadata_to_settings(block_ensemble,
+                                       created_blocks=created_blocks,
+                                       alternating=alternating,
+                                       controlled_variable=tau_array,
+                                       units=('s', ''),
+                                       labels=('Tau', 'Signal'),
+                                       number_of_lasers=number_of_lasers)
         # append ensemble to created ensembles
         created_ensembles.append(block_ensemble)
         return created_blocks, created_ensembles, created_sequences
@@ -659,17 +571,12 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
                                               phase=0)
 
         tau_element = self._get_idle_element(length=tau_start, increment=tau_step)
-        t1_block = PulseBlock(name=name)
-        t1_block.append(tau_element)
-        t1_block.append(laser_element)
-        t1_block.append(delay_element)
-        t1_block.append(waiting_element)
+        block_elements = [tau_element, laser_element, delay_element, waiting_element]
         if alternating:
-            t1_block.append(pi_element)
-            t1_block.append(tau_element)
-            t1_block.append(laser_element)
-            t1_block.append(delay_element)
-            t1_block.append(waiting_element)
+            block_elements.extend((pi_element, tau_element, laser_element, delay_element,
+                                   waiting_element))
+        t1_block = PulseBlock(name=name)
+        t1_block.extend(block_elements)
         created_blocks.append(t1_block)
 
         # Create block ensemble
@@ -681,14 +588,13 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
 
         # add metadata to invoke settings later on
         number_of_lasers = 2 * num_of_points if alternating else num_of_points
-        block_ensemble.measurement_information['alternating'] = alternating
-        block_ensemble.measurement_information['laser_ignore_list'] = list()
-        block_ensemble.measurement_information['controlled_variable'] = tau_array
-        block_ensemble.measurement_information['units'] = ('s', '')
-        block_ensemble.measurement_information['labels'] = ('Tau<sub>pulse spacing</sub>', 'Signal')
-        block_ensemble.measurement_information['number_of_lasers'] = number_of_lasers
-        block_ensemble.measurement_information['counting_length'] = self._get_ensemble_count_length(
-            ensemble=block_ensemble, created_blocks=created_blocks)
+        self._add_metadata_to_settings(block_ensemble,
+                                       created_blocks=created_blocks,
+                                       alternating=alternating,
+                                       controlled_variable=tau_array,
+                                       units=('s', ''),
+                                       labels=('Tau<sub>pulse spacing</sub>', 'Signal'),
+                                       number_of_lasers=number_of_lasers)
         # append ensemble to created ensembles
         created_ensembles.append(block_ensemble)
         return created_blocks, created_ensembles, created_sequences
@@ -721,19 +627,15 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
                                               amp=self.microwave_amplitude,
                                               freq=self.microwave_frequency,
                                               phase=0)
-        t1_block = PulseBlock(name=name)
+        block_elements = list()
         for tau in tau_array:
             tau_element = self._get_idle_element(length=tau, increment=0.0)
-            t1_block.append(tau_element)
-            t1_block.append(laser_element)
-            t1_block.append(delay_element)
-            t1_block.append(waiting_element)
+            block_elements.extend((tau_element, laser_element, delay_element, waiting_element))
             if alternating:
-                t1_block.append(pi_element)
-                t1_block.append(tau_element)
-                t1_block.append(laser_element)
-                t1_block.append(delay_element)
-                t1_block.append(waiting_element)
+                block_elements.extend((pi_element, tau_element, laser_element, delay_element,
+                                       waiting_element))
+        t1_block = PulseBlock(name=name)
+        t1_block.extend(block_elements)
         created_blocks.append(t1_block)
 
         # Create block ensemble
@@ -745,14 +647,13 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
 
         # add metadata to invoke settings later on
         number_of_lasers = 2 * num_of_points if alternating else num_of_points
-        block_ensemble.measurement_information['alternating'] = alternating
-        block_ensemble.measurement_information['laser_ignore_list'] = list()
-        block_ensemble.measurement_information['controlled_variable'] = tau_array
-        block_ensemble.measurement_information['units'] = ('s', '')
-        block_ensemble.measurement_information['labels'] = ('Tau<sub>pulse spacing</sub>', 'Signal')
-        block_ensemble.measurement_information['number_of_lasers'] = number_of_lasers
-        block_ensemble.measurement_information['counting_length'] = self._get_ensemble_count_length(
-            ensemble=block_ensemble, created_blocks=created_blocks)
+        self._add_metadata_to_settings(block_ensemble,
+                                       created_blocks=created_blocks,
+                                       alternating=alternating,
+                                       controlled_variable=tau_array,
+                                       units=('s', ''),
+                                       labels=('Tau<sub>pulse spacing</sub>', 'Signal'),
+                                       number_of_lasers=number_of_lasers)
         # append ensemble to created ensembles
         created_ensembles.append(block_ensemble)
         return created_blocks, created_ensembles, created_sequences
@@ -778,41 +679,25 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
                                               amp=self.microwave_amplitude,
                                               freq=self.microwave_frequency,
                                               phase=0)
-        # Use a 180 deg phase shiftet pulse as 3pihalf pulse if microwave channel is analog
-        if self.microwave_channel.startswith('a'):
-            pi3half_element = self._get_mw_element(length=self.rabi_period / 4,
-                                                   increment=0,
-                                                   amp=self.microwave_amplitude,
-                                                   freq=self.microwave_frequency,
-                                                   phase=180)
-        else:
-            pi3half_element = self._get_mw_element(length=3 * self.rabi_period / 4,
-                                                   increment=0,
-                                                   amp=self.microwave_amplitude,
-                                                   freq=self.microwave_frequency,
-                                                   phase=0)
+        pi3half_element = self._get_pi3half_element()
 
-        # Create block and append to created_blocks list
-        hhamp_block = PulseBlock(name=name)
+        mw_freq = self.microwave_frequency
+
+        block_elements = list()
         for sl_amp in amp_array:
             sl_element = self._get_mw_element(length=spinlock_length,
                                               increment=0,
                                               amp=sl_amp,
-                                              freq=self.microwave_frequency,
+                                              freq=mw_freq,
                                               phase=90)
-            hhamp_block.append(pihalf_element)
-            hhamp_block.append(sl_element)
-            hhamp_block.append(pihalf_element)
-            hhamp_block.append(laser_element)
-            hhamp_block.append(delay_element)
-            hhamp_block.append(waiting_element)
-
-            hhamp_block.append(pi3half_element)
-            hhamp_block.append(sl_element)
-            hhamp_block.append(pihalf_element)
-            hhamp_block.append(laser_element)
-            hhamp_block.append(delay_element)
-            hhamp_block.append(waiting_element)
+            block_elements.extend((pihalf_element, sl_element, pihalf_element, laser_element,
+                                   delay_element, waiting_element))
+
+            block_elements.extend((pi3half_element, sl_element, pihalf_element, laser_element,
+                                   delay_element, waiting_element))
+        # Create block and append to created_blocks list
+        hhamp_block = PulseBlock(name=name)
+        hhamp_block.extend(block_elements)
         created_blocks.append(hhamp_block)
 
         # Create block ensemble
@@ -823,14 +708,13 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
         self._add_trigger(created_blocks=created_blocks, block_ensemble=block_ensemble)
 
         # add metadata to invoke settings later on
-        block_ensemble.measurement_information['alternating'] = True
-        block_ensemble.measurement_information['laser_ignore_list'] = list()
-        block_ensemble.measurement_information['controlled_variable'] = amp_array
-        block_ensemble.measurement_information['units'] = ('V', '')
-        block_ensemble.measurement_information['labels'] = ('MW amplitude', 'Signal')
-        block_ensemble.measurement_information['number_of_lasers'] = 2 * num_of_points
-        block_ensemble.measurement_information['counting_length'] = self._get_ensemble_count_length(
-            ensemble=block_ensemble, created_blocks=created_blocks)
+        self._add_metadata_to_settings(block_ensemble,
+                                       created_blocks=created_blocks,
+                                       alternating=True,
+                                       controlled_variable=amp_array,
+                                       units=('V', ''),
+                                       labels=('MW amplitude', 'Signal'),
+                                       number_of_lasers=2 * num_of_points)
 
         # append ensemble to created ensembles
         created_ensembles.append(block_ensemble)
@@ -857,19 +741,7 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
                                               amp=self.microwave_amplitude,
                                               freq=self.microwave_frequency,
                                               phase=0)
-        # Use a 180 deg phase shiftet pulse as 3pihalf pulse if microwave channel is analog
-        if self.microwave_channel.startswith('a'):
-            pi3half_element = self._get_mw_element(length=self.rabi_period / 4,
-                                                   increment=0,
-                                                   amp=self.microwave_amplitude,
-                                                   freq=self.microwave_frequency,
-                                                   phase=180)
-        else:
-            pi3half_element = self._get_mw_element(length=3 * self.rabi_period / 4,
-                                                   increment=0,
-                                                   amp=self.microwave_amplitude,
-                                                   freq=self.microwave_frequency,
-                                                   phase=0)
+        pi3half_element = self._get_pi3half_element()
         sl_element = self._get_mw_element(length=tau_start,
                                           increment=tau_step,
                                           amp=spinlock_amp,
@@ -878,19 +750,9 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
 
         # Create block and append to created_blocks list
         hhtau_block = PulseBlock(name=name)
-        hhtau_block.append(pihalf_element)
-        hhtau_block.append(sl_element)
-        hhtau_block.append(pihalf_element)
-        hhtau_block.append(laser_element)
-        hhtau_block.append(delay_element)
-        hhtau_block.append(waiting_element)
-
-        hhtau_block.append(pi3half_element)
-        hhtau_block.append(sl_element)
-        hhtau_block.append(pihalf_element)
-        hhtau_block.append(laser_element)
-        hhtau_block.append(delay_element)
-        hhtau_block.append(waiting_element)
+        hhtau_block.extend((pihalf_element, sl_element, pihalf_element, laser_element,
+                            delay_element, waiting_element, pi3half_element, sl_element,
+                            pihalf_element, laser_element, delay_element, waiting_element))
         created_blocks.append(hhtau_block)
 
         # Create block ensemble
@@ -901,14 +763,13 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
         self._add_trigger(created_blocks=created_blocks, block_ensemble=block_ensemble)
 
         # add metadata to invoke settings later on
-        block_ensemble.measurement_information['alternating'] = True
-        block_ensemble.measurement_information['laser_ignore_list'] = list()
-        block_ensemble.measurement_information['controlled_variable'] = tau_array
-        block_ensemble.measurement_information['units'] = ('s', '')
-        block_ensemble.measurement_information['labels'] = ('Spinlock time', 'Signal')
-        block_ensemble.measurement_information['number_of_lasers'] = 2 * num_of_points
-        block_ensemble.measurement_information['counting_length'] = self._get_ensemble_count_length(
-            ensemble=block_ensemble, created_blocks=created_blocks)
+        self._add_metadata_to_settings(block_ensemble,
+                                       created_blocks=created_blocks,
+                                       alternating=True,
+                                       controlled_variable=tau_array,
+                                       units=('s', ''),
+                                       labels=('Spinlock time', 'Signal'),
+                                       number_of_lasers=2 * num_of_points)
 
         # append ensemble to created ensembles
         created_ensembles.append(block_ensemble)
@@ -935,19 +796,7 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
                                               amp=self.microwave_amplitude,
                                               freq=self.microwave_frequency,
                                               phase=0)
-        # Use a 180 deg phase shiftet pulse as 3pihalf pulse if microwave channel is analog
-        if self.microwave_channel.startswith('a'):
-            pi3half_element = self._get_mw_element(length=self.rabi_period / 4,
-                                                   increment=0,
-                                                   amp=self.microwave_amplitude,
-                                                   freq=self.microwave_frequency,
-                                                   phase=180)
-        else:
-            pi3half_element = self._get_mw_element(length=3 * self.rabi_period / 4,
-                                                   increment=0,
-                                                   amp=self.microwave_amplitude,
-                                                   freq=self.microwave_frequency,
-                                                   phase=0)
+        pi3half_element = self._get_pi3half_element()
         sl_element = self._get_mw_element(length=spinlock_length,
                                           increment=0,
                                           amp=spinlock_amp,
@@ -956,22 +805,14 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
 
         # Create block for "up"-polarization and append to created_blocks list
         up_block = PulseBlock(name=name + '_up')
-        up_block.append(pihalf_element)
-        up_block.append(sl_element)
-        up_block.append(pihalf_element)
-        up_block.append(laser_element)
-        up_block.append(delay_element)
-        up_block.append(waiting_element)
+        up_block.extend((pihalf_element, sl_element, pihalf_element, laser_element, delay_element,
+                         waiting_element))
         created_blocks.append(up_block)
 
         # Create block for "down"-polarization and append to created_blocks list
         down_block = PulseBlock(name=name + '_down')
-        down_block.append(pi3half_element)
-        down_block.append(sl_element)
-        down_block.append(pi3half_element)
-        down_block.append(laser_element)
-        down_block.append(delay_element)
-        down_block.append(waiting_element)
+        down_block.extend((pi3half_element, sl_element, pi3half_element, laser_element,
+                           delay_element, waiting_element))
         created_blocks.append(down_block)
 
         # Create block ensemble
@@ -983,14 +824,13 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
         self._add_trigger(created_blocks=created_blocks, block_ensemble=block_ensemble)
 
         # add metadata to invoke settings later on
-        block_ensemble.measurement_information['alternating'] = False
-        block_ensemble.measurement_information['laser_ignore_list'] = list()
-        block_ensemble.measurement_information['controlled_variable'] = steps_array
-        block_ensemble.measurement_information['units'] = ('#', '')
-        block_ensemble.measurement_information['labels'] = ('Polarization Steps', 'Signal')
-        block_ensemble.measurement_information['number_of_lasers'] = 2 * polarization_steps
-        block_ensemble.measurement_information['counting_length'] = self._get_ensemble_count_length(
-            ensemble=block_ensemble, created_blocks=created_blocks)
+        self._add_metadata_to_settings(block_ensemble,
+                                       created_blocks=created_blocks,
+                                       alternating=False,
+                                       controlled_variable=steps_array,
+                                       units=('#', ''),
+                                       labels=('Polarization Steps', 'Signal'),
+                                       number_of_lasers=2 * polarization_steps)
 
         # append ensemble to created ensembles
         created_ensembles.append(block_ensemble)
@@ -1035,9 +875,7 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
             sync_element = self._get_sync_element()
             # Create PulseBlock and append PulseBlockElements
             sync_readout_block = PulseBlock(name='{0}_readout_sync'.format(name))
-            sync_readout_block.append(laser_element)
-            sync_readout_block.append(delay_element)
-            sync_readout_block.append(sync_element)
+            sync_readout_block.extend((laser_element, delay_element, sync_element))
             created_blocks.append(sync_readout_block)
             # Create PulseBlockEnsemble and append block to it
             sync_readout_ensemble = PulseBlockEnsemble(name='{0}_readout_sync'.format(name),
@@ -1060,19 +898,22 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
         # Create the PulseSequence and append the PulseBlockEnsemble names as sequence steps
         # together with the necessary parameters.
         t1_sequence = PulseSequence(name=name, rotating_frame=False)
+        # the ensembles do not change within the loop, so their count lengths are constant
+        tau_count_length = self._get_ensemble_count_length(ensemble=tau_ensemble,
+                                                           created_blocks=created_blocks)
+        readout_count_length = self._get_ensemble_count_length(ensemble=readout_ensemble,
+                                                               created_blocks=created_blocks)
         count_length = 0.0
         for k in k_array:
             t1_sequence.append(tau_ensemble.name)
             t1_sequence[-1].repetitions = int(k) - 1
-            count_length += k * self._get_ensemble_count_length(ensemble=tau_ensemble,
-                                                                created_blocks=created_blocks)
+            count_length += k * tau_count_length
 
             if self.sync_channel and k == k_array[-1]:
                 t1_sequence.append(sync_readout_ensemble.name)
             else:
                 t1_sequence.append(readout_ensemble.name)
-            count_length += self._get_ensemble_count_length(ensemble=readout_ensemble,
-                                                            created_blocks=created_blocks)
+            count_length += readout_count_length
         # Make the sequence loop infinitely by setting the go_to parameter of the last sequence
         # step to the first step.
         t1_sequence[-1].go_to = 1
@@ -1122,8 +963,7 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
         laser_element = self._get_laser_gate_element(length=self.laser_length, increment=0)
         delay_element = self._get_delay_gate_element()
 
-        # Create block and append to created_blocks list
-        chirpedodmr_block = PulseBlock(name=name)
+        block_elements = list()
 
         # Create frequency array
         mw_freq_start = mw_freq_center - freq_range / 2.
@@ -1133,19 +973,20 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
         if pulse_length > expected_t2:
             self.log.error('The duration of the chirped pulse exceeds expected the T2 time')
 
+        mw_amp = self.microwave_amplitude
         for mw_freq in freq_array:
             mw_element = self._get_mw_element_linearchirp(length=pulse_length,
                                                           increment=0,
-                                                          amplitude=self.microwave_amplitude,
+                                                          amplitude=mw_amp,
                                                           start_freq=(mw_freq - mw_freq_incr / 2.
                                                                       - freq_overlap),
                                                           stop_freq=(mw_freq + mw_freq_incr / 2.
                                                                      + freq_overlap),
                                                           phase=0)
-            chirpedodmr_block.append(mw_element)
-            chirpedodmr_block.append(laser_element)
-            chirpedodmr_block.append(delay_element)
-            chirpedodmr_block.append(waiting_element)
+            block_elements.extend((mw_element, laser_element, delay_element, waiting_element))
+        # Create block and append to created_blocks list
+        chirpedodmr_block = PulseBlock(name=name)
+        chirpedodmr_block.extend(block_elements)
         created_blocks.append(chirpedodmr_block)
 
         # Create block ensemble
@@ -1189,14 +1030,13 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
                 approx_transfer_eff_perfect_adiab))
 
         # add metadata to invoke settings later on
-        block_ensemble.measurement_information['alternating'] = False
-        block_ensemble.measurement_information['laser_ignore_list'] = list()
-        block_ensemble.measurement_information['controlled_variable'] = freq_array
-        block_ensemble.measurement_information['labels'] = ('Frequency', '')
-        block_ensemble.measurement_information['units'] = ('Hz', '')
-        block_ensemble.measurement_information['number_of_lasers'] = num_of_points
-        block_ensemble.measurement_information['counting_length'] = self._get_ensemble_count_length(
-            ensemble=block_ensemble, created_blocks=created_blocks)
+        self._add_metadata_to_settings(block_ensemble,
+                                       created_blocks=created_blocks,
+                                       alternating=False,
+                                       controlled_variable=freq_array,
+                                       units=('Hz', ''),
+                                       labels=('Frequency', ''),
+                                       number_of_lasers=num_of_points)
 
         # append ensemble to created ensembles
         created_ensembles.append(block_ensemble)
@@ -1249,8 +1089,7 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
         laser_element = self._get_laser_gate_element(length=self.laser_length, increment=0)
         delay_element = self._get_delay_gate_element()
 
-        # Create block and append to created_blocks list
-        chirpedodmr_block = PulseBlock(name=name)
+        block_elements = list()
 
         # Create frequency array
         mw_freq_start = mw_freq_center - freq_range / 2.
@@ -1270,10 +1109,10 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
                                                                  + freq_overlap),
                                                       phase=0,
                                                       truncation_ratio=truncation_ratio)
-            chirpedodmr_block.append(mw_element)
-            chirpedodmr_block.append(laser_element)
-            chirpedodmr_block.append(delay_element)
-            chirpedodmr_block.append(waiting_element)
+            block_elements.extend((mw_element, laser_element, delay_element, waiting_element))
+        # Create block and append to created_blocks list
+        chirpedodmr_block = PulseBlock(name=name)
+        chirpedodmr_block.extend(block_elements)
         created_blocks.append(chirpedodmr_block)
 
         # Create block ensemble
@@ -1317,14 +1156,13 @@ class BasicPredefinedGenerator(PredefinedGeneratorBase):
                 approx_transfer_eff_perfect_adiab_ae))
 
         # add metadata to invoke settings later on
-        block_ensemble.measurement_information['alternating'] = False
-        block_ensemble.measurement_information['laser_ignore_list'] = list()
-        block_ensemble.measurement_information['controlled_variable'] = freq_array
-        block_ensemble.measurement_information['labels'] = ('Frequency', '')
-        block_ensemble.measurement_information['units'] = ('Hz', '')
-        block_ensemble.measurement_information['number_of_lasers'] = num_of_points
-        block_ensemble.measurement_information['counting_length'] = self._get_ensemble_count_length(
-            ensemble=block_ensemble, created_blocks=created_blocks)
+        self._add_metadata_to_settings(block_ensemble,
+                                       created_blocks=created_blocks,
+                                       alternating=False,
+                                       controlled_variable=freq_array,
+                                       units=('Hz', ''),
+                                       labels=('Frequency', ''),
+                                       number_of_lasers=num_of_points)
 
         # append ensemble to created ensembles
         created_ensembles.append(block_ensemble)
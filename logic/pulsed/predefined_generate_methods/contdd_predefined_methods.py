@@ -23,7 +23,6 @@ top-level directory of this distribution and at <https://github.com/Ulm-IQO/qudi
 import numpy as np
 from logic.pulsed.pulse_objects import PulseBlock, PulseBlockEnsemble
 from logic.pulsed.pulse_objects import PredefinedGeneratorBase
-from logic.pulsed.sampling_functions import DDMethods
 
 
 
@@ -48,27 +47,13 @@ class ContDDPredefinedGenerator(PredefinedGeneratorBase):
         tau_array = tau_start + np.arange(num_of_points) * tau_step
 
         # create the elements
-        waiting_element = self._get_idle_element(length=self.wait_time, increment=0)
-        laser_element = self._get_laser_gate_element(length=self.laser_length, increment=0)
-        delay_element = self._get_delay_gate_element()
+        readout_elements = self._get_readout_element()
         pihalf_element = self._get_mw_element(length=self.rabi_period / 4,
                                               increment=0,
                                               amp=self.microwave_amplitude,
                                               freq=self.microwave_frequency,
                                               phase=0)
-        # Use a 180 deg phase shifted pulse as 3pihalf pulse if microwave channel is analog
-        if self.microwave_channel.startswith('a'):
-            pi3half_element = self._get_mw_element(length=self.rabi_period / 4,
-                                                   increment=0,
-                                                   amp=self.microwave_amplitude,
-                                                   freq=self.microwave_frequency,
-                                                   phase=180)
-        else:
-            pi3half_element = self._get_mw_element(length=3 * self.rabi_period / 4,
-                                                   increment=0,
-                                                   amp=self.microwave_amplitude,
-                                                   freq=self.microwave_frequency,
-                                                   phase=0)
+        pi3half_element = self._get_pi3half_element()
         pix_element = self._get_mw_element(length=tau_start,
                                            increment=tau_step,
                                            amp=amp_hh,
@@ -79,37 +64,20 @@ class ContDDPredefinedGenerator(PredefinedGeneratorBase):
                                            amp=amp_hh,
                                            freq=self.microwave_frequency,
                                            phase=90)
+        # one XY8 like phase cycle of the continuous drive
+        xy8_elements = [pix_element, piy_element, pix_element, piy_element,
+                        piy_element, pix_element, piy_element, pix_element]
+        read_elements = (pihalf_element, pi3half_element) if alternating else (pihalf_element,)
+
         # Create block and append to created_blocks list
+        block_elements = list()
+        for read_element in read_elements:
+            block_elements.append(pihalf_element)
+            block_elements.extend(xy8_elements * xy8_order)
+            block_elements.append(read_element)
+            block_elements.extend(readout_elements)
         hhphase_block = PulseBlock(name=name)
-        hhphase_block.append(pihalf_element)
-        for n in range(xy8_order):
-            hhphase_block.append(pix_element)
-            hhphase_block.append(piy_element)
-            hhphase_block.append(pix_element)
-            hhphase_block.append(piy_element)
-            hhphase_block.append(piy_element)
-            hhphase_block.append(pix_element)
-            hhphase_block.append(piy_element)
-            hhphase_block.append(pix_element)
-        hhphase_block.append(pihalf_element)
-        hhphase_block.append(laser_element)
-        hhphase_block.append(delay_element)
-        hhphase_block.append(waiting_element)
-        if alternating:
-            hhphase_block.append(pihalf_element)
-            for n in range(xy8_order):
-                hhphase_block.append(pix_element)
-                hhphase_block.append(piy_element)
-                hhphase_block.append(pix_element)
-                hhphase_block.append(piy_element)
-                hhphase_block.append(piy_element)
-                hhphase_block.append(pix_element)
-                hhphase_block.append(piy_element)
-                hhphase_block.append(pix_element)
-            hhphase_block.append(pi3half_element)
-            hhphase_block.append(laser_element)
-            hhphase_block.append(delay_element)
-            hhphase_block.append(waiting_element)
+        hhphase_block.extend(block_elements)
         created_blocks.append(hhphase_block)
 
         # Create block ensemble
@@ -121,14 +89,13 @@ class ContDDPredefinedGenerator(PredefinedGeneratorBase):
 
         # add metadata to invoke settings later on
         number_of_lasers = num_of_points * 2 if alternating else num_of_points
-        block_ensemble.measurement_information['alternating'] = alternating
-        block_ensemble.measurement_information['laser_ignore_list'] = list()
-        block_ensemble.measurement_information['controlled_variable'] = tau_array
-        block_ensemble.measurement_information['units'] = ('s', '')
-        block_ensemble.measurement_information['labels'] = ('Frequency', 'Signal')
-        block_ensemble.measurement_information['number_of_lasers'] = number_of_lasers
-        block_ensemble.measurement_information['counting_length'] = self._get_ensemble_count_length(
-            ensemble=block_ensemble, created_blocks=created_blocks)
+        self._add_metadata_to_settings(block_ensemble,
+                                       created_blocks=created_blocks,
+                                       alternating=alternating,
+                                       controlled_variable=tau_array,
+                                       units=('s', ''),
+                                       labels=('Frequency', 'Signal'),
+                                       number_of_lasers=number_of_lasers)
 
         # append ensemble to created ensembles
         created_ensembles.append(block_ensemble)
@@ -147,27 +114,13 @@ class ContDDPredefinedGenerator(PredefinedGeneratorBase):
         order_array = order_start + np.arange(num_of_points) * order_step
 
         # create the elements
-        waiting_element = self._get_idle_element(length=self.wait_time, increment=0)
-        laser_element = self._get_laser_gate_element(length=self.laser_length, increment=0)
-        delay_element = self._get_delay_gate_element()
+        readout_elements = self._get_readout_element()
         pihalf_element = self._get_mw_element(length=self.rabi_period / 4,
                                               increment=0,
                                               amp=self.microwave_amplitude,
                                               freq=self.microwave_frequency,
                                               phase=0)
-        # Use a 180 deg phase shifted pulse as 3pihalf pulse if microwave channel is analog
-        if self.microwave_channel.startswith('a'):
-            pi3half_element = self._get_mw_element(length=self.rabi_period / 4,
-                                                   increment=0,
-                                                   amp=self.microwave_amplitude,
-                                                   freq=self.microwave_frequency,
-                                                   phase=180)
-        else:
-            pi3half_element = self._get_mw_element(length=3 * self.rabi_period / 4,
-                                                   increment=0,
-                                                   amp=self.microwave_amplitude,
-                                                   freq=self.microwave_frequency,
-                                                   phase=0)
+        pi3half_element = self._get_pi3half_element()
         pix_element = self._get_mw_element(length=tau,
                                            increment=0,
                                            amp=amp_hh,
@@ -179,38 +132,21 @@ class ContDDPredefinedGenerator(PredefinedGeneratorBase):
                                            freq=self.microwave_frequency,
                                            phase=90)
 
+        # one XY8 like phase cycle of the continuous drive
+        xy8_elements = [pix_element, piy_element, pix_element, piy_element,
+                        piy_element, pix_element, piy_element, pix_element]
+        read_elements = (pihalf_element, pi3half_element) if alternating else (pihalf_element,)
+
         # Create block and append to created_blocks list
-        hhphase_block = PulseBlock(name=name)
+        block_elements = list()
         for xy8_order in order_array:
-            hhphase_block.append(pihalf_element)
-            for n in range(xy8_order):
-                hhphase_block.append(pix_element)
-                hhphase_block.append(piy_element)
-                hhphase_block.append(pix_element)
-                hhphase_block.append(piy_element)
-                hhphase_block.append(piy_element)
-                hhphase_block.append(pix_element)
-                hhphase_block.append(piy_element)
-                hhphase_block.append(pix_element)
-            hhphase_block.append(pihalf_element)
-            hhphase_block.append(laser_element)
-            hhphase_block.append(delay_element)
-            hhphase_block.append(waiting_element)
-            if alternating:
-                hhphase_block.append(pihalf_element)
-                for n in range(xy8_order):
-                    hhphase_block.append(pix_element)
-                    hhphase_block.append(piy_element)
-                    hhphase_block.append(pix_element)
-                    hhphase_block.append(piy_element)
-                    hhphase_block.append(piy_element)
-                    hhphase_block.append(pix_element)
-                    hhphase_block.append(piy_element)
-                    hhphase_block.append(pix_element)
-                hhphase_block.append(pi3half_element)
-                hhphase_block.append(laser_element)
-                hhphase_block.append(delay_element)
-                hhphase_block.append(waiting_element)
+            for read_element in read_elements:
+                block_elements.append(pihalf_element)
+                block_elements.extend(xy8_elements * xy8_order)
+                block_elements.append(read_element)
+                block_elements.extend(readout_elements)
+        hhphase_block = PulseBlock(name=name)
+        hhphase_block.extend(block_elements)
         created_blocks.append(hhphase_block)
 
         # Create block ensemble
@@ -222,14 +158,13 @@ class ContDDPredefinedGenerator(PredefinedGeneratorBase):
 
         # add metadata to invoke settings later on
         number_of_lasers = num_of_points * 2 if alternating else num_of_points
-        block_ensemble.measurement_information['alternating'] = alternating
-        block_ensemble.measurement_information['laser_ignore_list'] = list()
-        block_ensemble.measurement_information['controlled_variable'] = order_array
-        block_ensemble.measurement_information['units'] = ('', '')
-        block_ensemble.measurement_information['labels'] = ('HHXY8 order', 'Signal')
-        block_ensemble.measurement_information['number_of_lasers'] = number_of_lasers
-        block_ensemble.measurement_information['counting_length'] = self._get_ensemble_count_length(
-            ensemble=block_ensemble, created_blocks=created_blocks)
+        self._add_metadata_to_settings(block_ensemble,
+                                       created_blocks=created_blocks,
+                                       alternating=alternating,
+                                       controlled_variable=order_array,
+                                       units=('', ''),
+                                       labels=('HHXY8 order', 'Signal'),
+                                       number_of_lasers=number_of_lasers)
 
         # append ensemble to created ensembles
         created_ensembles.append(block_ensemble)
@@ -248,27 +183,13 @@ class ContDDPredefinedGenerator(PredefinedGeneratorBase):
         tau_array = tau_start + np.arange(num_of_points) * tau_step
 
         # create the elements
-        waiting_element = self._get_idle_element(length=self.wait_time, increment=0)
-        laser_element = self._get_laser_gate_element(length=self.laser_length, increment=0)
-        delay_element = self._get_delay_gate_element()
+        readout_elements = self._get_readout_element()
         pihalf_element = self._get_mw_element(length=self.rabi_period / 4,
                                               increment=0,
                                               amp=self.microwave_amplitude,
                                               freq=self.microwave_frequency,
                                               phase=0)
-        # Use a 180 deg phase shifted pulse as 3pihalf pulse if microwave channel is analog
-        if self.microwave_channel.startswith('a'):
-            pi3half_element = self._get_mw_element(length=self.rabi_period / 4,
-                                                   increment=0,
-                                                   amp=self.microwave_amplitude,
-                                                   freq=self.microwave_frequency,
-                                                   phase=180)
-        else:
-            pi3half_element = self._get_mw_element(length=3 * self.rabi_period / 4,
-                                                   increment=0,
-                                                   amp=self.microwave_amplitude,
-                                                   freq=self.microwave_frequency,
-                                                   phase=0)
+        pi3half_element = self._get_pi3half_element()
         pix_element = self._get_mw_element(length=tau_start,
                                            increment=tau_step,
                                            amp=amp_hh,
@@ -280,25 +201,19 @@ class ContDDPredefinedGenerator(PredefinedGeneratorBase):
                                            freq=self.microwave_frequency,
                                            phase=180)
 
+        # one 0/180 phase cycle of the continuous drive
+        rot_echo_elements = [pix_element, piy_element]
+        read_elements = (pihalf_element, pi3half_element) if alternating else (pihalf_element,)
+
         # Create block and append to created_blocks list
+        block_elements = list()
+        for read_element in read_elements:
+            block_elements.append(pihalf_element)
+            block_elements.extend(rot_echo_elements * order)
+            block_elements.append(read_element)
+            block_elements.extend(readout_elements)
         rotecho_block = PulseBlock(name=name)
-        rotecho_block.append(pihalf_element)
-        for n in range(order):
-            rotecho_block.append(pix_element)
-            rotecho_block.append(piy_element)
-        rotecho_block.append(pihalf_element)
-        rotecho_block.append(laser_element)
-        rotecho_block.append(delay_element)
-        rotecho_block.append(waiting_element)
-        if alternating:
-            rotecho_block.append(pihalf_element)
-            for n in range(order):
-                rotecho_block.append(pix_element)
-                rotecho_block.append(piy_element)
-            rotecho_block.append(pi3half_element)
-            rotecho_block.append(laser_element)
-            rotecho_block.append(delay_element)
-            rotecho_block.append(waiting_element)
+        rotecho_block.extend(block_elements)
         created_blocks.append(rotecho_block)
 
         # Create block ensemble
@@ -310,14 +225,13 @@ class ContDDPredefinedGenerator(PredefinedGeneratorBase):
 
         # add metadata to invoke settings later on
         number_of_lasers = num_of_points * 2 if alternating else num_of_points
-        block_ensemble.measurement_information['alternating'] = alternating
-        block_ensemble.measurement_information['laser_ignore_list'] = list()
-        block_ensemble.measurement_information['controlled_variable'] = tau_array
-        block_ensemble.measurement_information['units'] = ('s', '')
-        block_ensemble.measurement_information['labels'] = ('Frequency', 'Signal')
-        block_ensemble.measurement_information['number_of_lasers'] = number_of_lasers
-        block_ensemble.measurement_information['counting_length'] = self._get_ensemble_count_length(
-            ensemble=block_ensemble, created_blocks=created_blocks)
+        self._add_metadata_to_settings(block_ensemble,
+                                       created_blocks=created_blocks,
+                                       alternating=alternating,
+                                       controlled_variable=tau_array,
+                                       units=('s', ''),
+                                       labels=('Frequency', 'Signal'),
+                                       number_of_lasers=number_of_lasers)
 
         # append ensemble to created ensembles
         created_ensembles.append(block_ensemble)
@@ -336,27 +250,13 @@ class ContDDPredefinedGenerator(PredefinedGeneratorBase):
         order_array = order_start + np.arange(num_of_points) * order_step
 
         # create the elements
-        waiting_element = self._get_idle_element(length=self.wait_time, increment=0)
-        laser_element = self._get_laser_gate_element(length=self.laser_length, increment=0)
-        delay_element = self._get_delay_gate_element()
+        readout_elements = self._get_readout_element()
         pihalf_element = self._get_mw_element(length=self.rabi_period / 4,
                                               increment=0,
                                               amp=self.microwave_amplitude,
                                               freq=self.microwave_frequency,
                                               phase=0)
-        # Use a 180 deg phase shifted pulse as 3pihalf pulse if microwave channel is analog
-        if self.microwave_channel.startswith('a'):
-            pi3half_element = self._get_mw_element(length=self.rabi_period / 4,
-                                                   increment=0,
-                                                   amp=self.microwave_amplitude,
-                                                   freq=self.microwave_frequency,
-                                                   phase=180)
-        else:
-            pi3half_element = self._get_mw_element(length=3 * self.rabi_period / 4,
-                                                   increment=0,
-                                                   amp=self.microwave_amplitude,
-                                                   freq=self.microwave_frequency,
-                                                   phase=0)
+        pi3half_element = self._get_pi3half_element()
         pix_element = self._get_mw_element(length=tau,
                                            increment=0,
                                            amp=amp_hh,
@@ -367,26 +267,20 @@ class ContDDPredefinedGenerator(PredefinedGeneratorBase):
                                            amp=amp_hh,
                                            freq=self.microwave_frequency,
                                            phase=180)
+        # one 0/180 phase cycle of the continuous drive
+        rot_echo_elements = [pix_element, piy_element]
+        read_elements = (pihalf_element, pi3half_element) if alternating else (pihalf_element,)
+
         # Create block and append to created_blocks list
-        rot_echo_tau = PulseBlock(name=name)
+        block_elements = list()
         for order in order_array:
-            rot_echo_tau.append(pihalf_element)
-            for n in range(order):
-                rot_echo_tau.append(pix_element)
-                rot_echo_tau.append(piy_element)
-            rot_echo_tau.append(pihalf_element)
-            rot_echo_tau.append(laser_element)
-            rot_echo_tau.append(delay_element)
-            rot_echo_tau.append(waiting_element)
-            if alternating:
-                rot_echo_tau.append(pihalf_element)
-                for n in range(order):
-                    rot_echo_tau.append(pix_element)
-                    rot_echo_tau.append(piy_element)
-                rot_echo_tau.append(pi3half_element)
-                rot_echo_tau.append(laser_element)
-                rot_echo_tau.append(delay_element)
-                rot_echo_tau.append(waiting_element)
+            for read_element in read_elements:
+                block_elements.append(pihalf_element)
+                block_elements.extend(rot_echo_elements * order)
+                block_elements.append(read_element)
+                block_elements.extend(readout_elements)
+        rot_echo_tau = PulseBlock(name=name)
+        rot_echo_tau.extend(block_elements)
         created_blocks.append(rot_echo_tau)
 
         # Create block ensemble
@@ -398,14 +292,13 @@ class ContDDPredefinedGenerator(PredefinedGeneratorBase):
 
         # add metadata to invoke settings later on
         number_of_lasers = num_of_points * 2 if alternating else num_of_points
-        block_ensemble.measurement_information['alternating'] = alternating
-        block_ensemble.measurement_information['laser_ignore_list'] = list()
-        block_ensemble.measurement_information['controlled_variable'] = order_array
-        block_ensemble.measurement_information['units'] = ('', '')
-        block_ensemble.measurement_information['labels'] = ('order', 'Signal')
-        block_ensemble.measurement_information['number_of_lasers'] = number_of_lasers
-        block_ensemble.measurement_information['counting_length'] = self._get_ensemble_count_length(
-            ensemble=block_ensemble, created_blocks=created_blocks)
+        self._add_metadata_to_settings(block_ensemble,
+                                       created_blocks=created_blocks,
+                                       alternating=alternating,
+                                       controlled_variable=order_array,
+                                       units=('', ''),
+                                       labels=('order', 'Signal'),
+                                       number_of_lasers=number_of_lasers)
 
         # append ensemble to created ensembles
         created_ensembles.append(block_ensemble)
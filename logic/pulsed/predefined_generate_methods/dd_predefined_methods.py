@@ -23,7 +23,6 @@ top-level directory of this distribution and at <https://github.com/Ulm-IQO/qudi
 import numpy as np
 from logic.pulsed.pulse_objects import PulseBlock, PulseBlockEnsemble
 from logic.pulsed.pulse_objects import PredefinedGeneratorBase
-from logic.pulsed.sampling_functions import DDMethods
 
 
 
@@ -50,27 +49,13 @@ class DDPredefinedGenerator(PredefinedGeneratorBase):
         tau_pspacing_start = self.tau_2_pulse_spacing(tau_start)
 
         # create the elements
-        waiting_element = self._get_idle_element(length=self.wait_time, increment=0)
-        laser_element = self._get_laser_gate_element(length=self.laser_length, increment=0)
-        delay_element = self._get_delay_gate_element()
+        readout_elements = self._get_readout_element()
         pihalf_element = self._get_mw_element(length=self.rabi_period / 4,
                                               increment=0,
                                               amp=self.microwave_amplitude,
                                               freq=self.microwave_frequency,
                                               phase=0)
-        # Use a 180 deg phase shifted pulse as 3pihalf pulse if microwave channel is analog
-        if self.microwave_channel.startswith('a'):
-            pi3half_element = self._get_mw_element(length=self.rabi_period / 4,
-                                                   increment=0,
-                                                   amp=self.microwave_amplitude,
-                                                   freq=self.microwave_frequency,
-                                                   phase=180)
-        else:
-            pi3half_element = self._get_mw_element(length=3 * self.rabi_period / 4,
-                                                   increment=0,
-                                                   amp=self.microwave_amplitude,
-                                                   freq=self.microwave_frequency,
-                                                   phase=0)
+        pi3half_element = self._get_pi3half_element()
         pix_element = self._get_mw_element(length=self.rabi_period / 2,
                                            increment=0,
                                            amp=self.microwave_amplitude,
@@ -83,60 +68,30 @@ class DDPredefinedGenerator(PredefinedGeneratorBase):
                                            phase=90)
         tauhalf_element = self._get_idle_element(length=tau_pspacing_start / 2, increment=tau_step / 2)
         tau_element = self._get_idle_element(length=tau_pspacing_start, increment=tau_step)
+        # one XY8 period without the trailing free evolution
+        xy8_elements = [pix_element, tau_element, piy_element, tau_element,
+                        pix_element, tau_element, piy_element, tau_element,
+                        piy_element, tau_element, pix_element, tau_element,
+                        piy_element, tau_element, pix_element]
+
+        # free evolution and decoupling pulses between the two pi/2 pulses
+        decoupling_elements = [tauhalf_element]
+        for n in range(xy8_order):
+            if n != 0:
+                decoupling_elements.append(tau_element)
+            decoupling_elements.extend(xy8_elements)
+        decoupling_elements.append(tauhalf_element)
+        read_elements = (pihalf_element, pi3half_element) if alternating else (pihalf_element,)
 
         # Create block and append to created_blocks list
+        block_elements = list()
+        for read_element in read_elements:
+            block_elements.append(pihalf_element)
+            block_elements.extend(decoupling_elements)
+            block_elements.append(read_element)
+            block_elements.extend(readout_elements)
         xy8_block = PulseBlock(name=name)
-        xy8_block.append(pihalf_element)
-        xy8_block.append(tauhalf_element)
-        for n in range(xy8_order):
-            xy8_block.append(pix_element)
-            xy8_block.append(tau_element)
-            xy8_block.append(piy_element)
-            xy8_block.append(tau_element)
-            xy8_block.append(pix_element)
-            xy8_block.append(tau_element)
-            xy8_block.append(piy_element)
-            xy8_block.append(tau_element)
-            xy8_block.append(piy_element)
-            xy8_block.append(tau_element)
-            xy8_block.append(pix_element)
-            xy8_block.append(tau_element)
-            xy8_block.append(piy_element)
-            xy8_block.append(tau_element)
-            xy8_block.append(pix_element)
-            if n != xy8_order - 1:
-                xy8_block.append(tau_element)
-        xy8_block.append(tauhalf_element)
-        xy8_block.append(pihalf_element)
-        xy8_block.append(laser_element)
-        xy8_block.append(delay_element)
-        xy8_block.append(waiting_element)
-        if alternating:
-            xy8_block.append(pihalf_element)
-            xy8_block.append(tauhalf_element)
-            for n in range(xy8_order):
-                xy8_block.append(pix_element)
-                xy8_block.append(tau_element)
-                xy8_block.append(piy_element)
-                xy8_block.append(tau_element)
-                xy8_block.append(pix_element)
-                xy8_block.append(tau_element)
-                xy8_block.append(piy_element)
-                xy8_block.append(tau_element)
-                xy8_block.append(piy_element)
-                xy8_block.append(tau_element)
-                xy8_block.append(pix_element)
-                xy8_block.append(tau_element)
-                xy8_block.append(piy_element)
-                xy8_block.append(tau_element)
-                xy8_block.append(pix_element)
-                if n != xy8_order - 1:
-                    xy8_block.append(tau_element)
-            xy8_block.append(tauhalf_element)
-            xy8_block.append(pi3half_element)
-            xy8_block.append(laser_element)
-            xy8_block.append(delay_element)
-            xy8_block.append(waiting_element)
+        xy8_block.extend(block_elements)
         created_blocks.append(xy8_block)
 
         # Create block ensemble
@@ -148,14 +103,13 @@ class DDPredefinedGenerator(PredefinedGeneratorBase):
 
         # add metadata to invoke settings later on
         number_of_lasers = num_of_points * 2 if alternating else num_of_points
-        block_ensemble.measurement_information['alternating'] = alternating
-        block_ensemble.measurement_information['laser_ignore_list'] = list()
-        block_ensemble.measurement_information['controlled_variable'] = tau_array
-        block_ensemble.measurement_information['units'] = ('s', '')
-        block_ensemble.measurement_information['labels'] = ('Tau', 'Signal')
-        block_ensemble.measurement_information['number_of_lasers'] = number_of_lasers
-        block_ensemble.measurement_information['counting_length'] = self._get_ensemble_count_length(
-            ensemble=block_ensemble, created_blocks=created_blocks)
+        self._add_metadata_to_settings(block_ensemble,
+                                       created_blocks=created_blocks,
+                                       alternating=alternating,
+                                       controlled_variable=tau_array,
+                                       units=('s', ''),
+                                       labels=('Tau', 'Signal'),
+                                       number_of_lasers=number_of_lasers)
 
         # append ensemble to created ensembles
         created_ensembles.append(block_ensemble)
@@ -180,27 +134,13 @@ class DDPredefinedGenerator(PredefinedGeneratorBase):
         freq_array = 1 / (2 * (self.tau_2_pulse_spacing(tau_pspacing_array, inverse=True)))
 
         # create the elements
-        waiting_element = self._get_idle_element(length=self.wait_time, increment=0)
-        laser_element = self._get_laser_gate_element(length=self.laser_length, increment=0)
-        delay_element = self._get_delay_gate_element()
+        readout_elements = self._get_readout_element()
         pihalf_element = self._get_mw_element(length=self.rabi_period / 4,
                                               increment=0,
                                               amp=self.microwave_amplitude,
                                               freq=self.microwave_frequency,
                                               phase=0)
-        # Use a 180 deg phase shifted pulse as 3pihalf pulse if microwave channel is analog
-        if self.microwave_channel.startswith('a'):
-            pi3half_element = self._get_mw_element(length=self.rabi_period / 4,
-                                                   increment=0,
-                                                   amp=self.microwave_amplitude,
-                                                   freq=self.microwave_frequency,
-                                                   phase=180)
-        else:
-            pi3half_element = self._get_mw_element(length=3 * self.rabi_period / 4,
-                                                   increment=0,
-                                                   amp=self.microwave_amplitude,
-                                                   freq=self.microwave_frequency,
-                                                   phase=0)
+        pi3half_element = self._get_pi3half_element()
         pix_element = self._get_mw_element(length=self.rabi_period / 2,
                                            increment=0,
                                            amp=self.microwave_amplitude,
@@ -212,62 +152,33 @@ class DDPredefinedGenerator(PredefinedGeneratorBase):
                                            freq=self.microwave_frequency,
                                            phase=90)
 
+        # the final pi/2 (and pi3/2 for the alternating half) rotating back for readout
+        read_elements = (pihalf_element, pi3half_element) if alternating else (pihalf_element,)
+
         # Create block and append to created_blocks list
-        xy8_block = PulseBlock(name=name)
-        for ii, tau in enumerate(tau_pspacing_array):
+        block_elements = list()
+        for tau in tau_pspacing_array:
             tauhalf_element = self._get_idle_element(length=tau / 2, increment=0)
             tau_element = self._get_idle_element(length=tau, increment=0)
-            xy8_block.append(pihalf_element)
-            xy8_block.append(tauhalf_element)
+            # one XY8 period without the trailing free evolution
+            xy8_elements = [pix_element, tau_element, piy_element, tau_element,
+                            pix_element, tau_element, piy_element, tau_element,
+                            piy_element, tau_element, pix_element, tau_element,
+                            piy_element, tau_element, pix_element]
+            # free evolution and decoupling pulses between the two pi/2 pulses
+            decoupling_elements = [tauhalf_element]
             for n in range(xy8_order):
-                xy8_block.append(pix_element)
-                xy8_block.append(tau_element)
-                xy8_block.append(piy_element)
-                xy8_block.append(tau_element)
-                xy8_block.append(pix_element)
-                xy8_block.append(tau_element)
-                xy8_block.append(piy_element)
-                xy8_block.append(tau_element)
-                xy8_block.append(piy_element)
-                xy8_block.append(tau_element)
-                xy8_block.append(pix_element)
-                xy8_block.append(tau_element)
-                xy8_block.append(piy_element)
-                xy8_block.append(tau_element)
-                xy8_block.append(pix_element)
-                if n != xy8_order - 1:
-                    xy8_block.append(tau_element)
-            xy8_block.append(tauhalf_element)
-            xy8_block.append(pihalf_element)
-            xy8_block.append(laser_element)
-            xy8_block.append(delay_element)
-            xy8_block.append(waiting_element)
-            if alternating:
-                xy8_block.append(pihalf_element)
-                xy8_block.append(tauhalf_element)
-                for n in range(xy8_order):
-                    xy8_block.append(pix_element)
-                    xy8_block.append(tau_element)
-                    xy8_block.append(piy_element)
-                    xy8_block.append(tau_element)
-                    xy8_block.append(pix_element)
-                    xy8_block.append(tau_element)
-                    xy8_block.append(piy_element)
-                    xy8_block.append(tau_element)
-                    xy8_block.append(piy_element)
-                    xy8_block.append(tau_element)
-                    xy8_block.append(pix_element)
-                    xy8_block.append(tau_element)
-                    xy8_block.append(piy_element)
-                    xy8_block.append(tau_element)
-                    xy8_block.append(pix_element)
-                    if n != xy8_order - 1:
-                        xy8_block.append(tau_element)
-                xy8_block.append(tauhalf_element)
-                xy8_block.append(pi3half_element)
-                xy8_block.append(laser_element)
-                xy8_block.append(delay_element)
-                xy8_block.append(waiting_element)
+                if n != 0:
+                    decoupling_elements.append(tau_element)
+                decoupling_elements.extend(xy8_elements)
+            decoupling_elements.append(tauhalf_element)
+            for read_element in read_elements:
+                block_elements.append(pihalf_element)
+                block_elements.extend(decoupling_elements)
+                block_elements.append(read_element)
+                block_elements.extend(readout_elements)
+        xy8_block = PulseBlock(name=name)
+        xy8_block.extend(block_elements)
         created_blocks.append(xy8_block)
 
         # Create block ensemble
@@ -279,14 +190,13 @@ class DDPredefinedGenerator(PredefinedGeneratorBase):
 
         # add metadata to invoke settings later on
         number_of_lasers = num_of_points * 2 if alternating else num_of_points
-        block_ensemble.measurement_information['alternating'] = alternating
-        block_ensemble.measurement_information['laser_ignore_list'] = list()
-        block_ensemble.measurement_information['controlled_variable'] = freq_array
-        block_ensemble.measurement_information['units'] = ('Hz', '')
-        block_ensemble.measurement_information['labels'] = ('Frequency', 'Signal')
-        block_ensemble.measurement_information['number_of_lasers'] = number_of_lasers
-        block_ensemble.measurement_information['counting_length'] = self._get_ensemble_count_length(
-            ensemble=block_ensemble, created_blocks=created_blocks)
+        self._add_metadata_to_settings(block_ensemble,
+                                       created_blocks=created_blocks,
+                                       alternating=alternating,
+                                       controlled_variable=freq_array,
+                                       units=('Hz', ''),
+                                       labels=('Frequency', 'Signal'),
+                                       number_of_lasers=number_of_lasers)
 
         # append ensemble to created ensembles
         created_ensembles.append(block_ensemble)
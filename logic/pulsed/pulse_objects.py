@@ -121,6 +121,21 @@ class PulseBlockElement(object):
                 return False
         return True
 
+    def __deepcopy__(self, memo):
+        # Only the sampling function instances need a recursive copy. Channel dicts and sets
+        # only hold strings and booleans, so plain copies of the containers are sufficient.
+        new_element = self.__class__.__new__(self.__class__)
+        memo[id(self)] = new_element
+        new_element.__dict__.update(self.__dict__)
+        new_element.pulse_function = copy.copy(self.pulse_function)
+        for chnl, func in self.pulse_function.items():
+            new_element.pulse_function[chnl] = copy.deepcopy(func, memo)
+        new_element.digital_high = copy.copy(self.digital_high)
+        new_element.analog_channels = self.analog_channels.copy()
+        new_element.digital_channels = self.digital_channels.copy()
+        new_element.channel_set = self.channel_set.copy()
+        return new_element
+
     def get_dict_representation(self):
         dict_repr = dict()
         dict_repr['init_length_s'] = self.init_length_s
@@ -358,8 +373,37 @@ class PulseBlock(object):
         return
 
     def extend(self, iterable):
-        for element in iterable:
-            self.append(element=element)
+        """ Append all PulseBlockElements from iterable to the end of the element list.
+        All elements are checked before the block is altered.
+
+        @param iterable: iterable of PulseBlockElement instances
+        """
+        elements = list(iterable)
+        channel_set = self.channel_set
+        add_length = 0
+        add_increment = 0
+        for element in elements:
+            if not isinstance(element, PulseBlockElement):
+                raise ValueError('PulseBlock elements must be of type PulseBlockElement, not {0}'
+                                 ''.format(type(element)))
+            if not channel_set:
+                channel_set = element.channel_set
+            elif element.channel_set != channel_set:
+                raise ValueError('Usage of different sets of analog and digital channels in the '
+                                 'same PulseBlock is prohibited. Used channel sets are:\n{0}\n{1}'
+                                 ''.format(channel_set, element.channel_set))
+            add_length += element.init_length_s
+            add_increment += element.increment_s
+
+        if channel_set and not self.channel_set:
+            self.channel_set = channel_set.copy()
+            self.analog_channels = {chnl for chnl in self.channel_set if chnl.startswith('a')}
+            self.digital_channels = {chnl for chnl in self.channel_set if chnl.startswith('d')}
+
+        self.init_length_s += add_length
+        self.increment_s += add_increment
+
+        self.element_list.extend(copy.deepcopy(element) for element in elements)
         return
 
     def clear(self):
@@ -1127,8 +1171,8 @@ class PredefinedGeneratorBase:
             t_phys = np.asarray(t_phys)
             tau = np.asarray(tau)
             if np.any(t_phys < 0):
-                self.log.warning("Adjusting negative physical pulse spacing to 0. Affected tau: {} "
-                                 .format(tau[t_phys < 0]))
+                self.log.warning('Adjusting negative physical pulse spacing to 0. Affected tau: %s',
+                                 tau[t_phys < 0])
                 t_phys[t_phys < 0] = 0
 
             return t_phys
@@ -1179,11 +1223,12 @@ class PredefinedGeneratorBase:
         digital_high = {chnl: False for chnl in self.digital_channels}
 
         # Determine analogue or digital trigger channel and set channels accordingly.
+        trigger_voltage = self.analog_trigger_voltage
         for channel in channels:
             if channel.startswith('d'):
                 digital_high[channel] = True
             elif channel.startswith('a'):
-                pulse_function[channel] = SamplingFunctions.DC(voltage=self.analog_trigger_voltage)
+                pulse_function[channel] = SamplingFunctions.DC(voltage=trigger_voltage)
 
         # return trigger element
         return PulseBlockElement(init_length_s=length,
@@ -1275,6 +1320,25 @@ class PredefinedGeneratorBase:
                 phase=phase)
         return mw_element
 
+    def _get_pi3half_element(self):
+        """
+        Creates a 3pi/2 MW pulse PulseBlockElement.
+        For an analog MW channel a 180 deg phase shifted pi/2 pulse is used instead.
+
+        @return: PulseBlockElement, the generated 3pi/2 element
+        """
+        if self.microwave_channel.startswith('a'):
+            return self._get_mw_element(length=self.rabi_period / 4,
+                                        increment=0,
+                                        amp=self.microwave_amplitude,
+                                        freq=self.microwave_frequency,
+                                        phase=180)
+        return self._get_mw_element(length=3 * self.rabi_period / 4,
+                                    increment=0,
+                                    amp=self.microwave_amplitude,
+                                    freq=self.microwave_frequency,
+                                    phase=0)
+
     def _get_multiple_mw_element(self, length, increment, amps=None, freqs=None, phases=None):
         """
         Creates single, double or triple sine mw element.
@@ -1438,26 +1502,23 @@ class PredefinedGeneratorBase:
                                   laser_ignore_list=None, controlled_variable=None, units=('s', ''),
                                   labels=('Tau', 'Signal'), number_of_lasers=None, counting_length=None):
 
-        block_ensemble.measurement_information['alternating'] = alternating
-        block_ensemble.measurement_information[
-            'laser_ignore_list'] = laser_ignore_list if laser_ignore_list is not None else list()
-        block_ensemble.measurement_information[
-            'controlled_variable'] = controlled_variable if controlled_variable is not None else [0, 1]
-        block_ensemble.measurement_information['units'] = units
-        block_ensemble.measurement_information['labels'] = labels
+        if laser_ignore_list is None:
+            laser_ignore_list = list()
+        if controlled_variable is None:
+            controlled_variable = [0, 1]
         if number_of_lasers is None:
-            if alternating:
-                block_ensemble.measurement_information['number_of_lasers'] = len(controlled_variable) * 2
-            else:
-                block_ensemble.measurement_information['number_of_lasers'] = len(controlled_variable)
-        else:
-            block_ensemble.measurement_information['number_of_lasers'] = number_of_lasers
+            number_of_lasers = len(controlled_variable) * 2 if alternating else len(controlled_variable)
         if counting_length is None:
-            block_ensemble.measurement_information['counting_length'] = self._get_ensemble_count_length(
-                ensemble=block_ensemble, created_blocks=created_blocks)
-        else:
-            block_ensemble.measurement_information['counting_length'] = counting_length
-
+            counting_length = self._get_ensemble_count_length(ensemble=block_ensemble,
+                                                              created_blocks=created_blocks)
+
+        block_ensemble.measurement_information.update({'alternating': alternating,
+                                                       'laser_ignore_list': laser_ignore_list,
+                                                       'controlled_variable': controlled_variable,
+                                                       'units': units,
+                                                       'labels': labels,
+                                                       'number_of_lasers': number_of_lasers,
+                                                       'counting_length': counting_length})
         return block_ensemble
 
     def _adjust_to_samplingrate(self, value, divisibility):
@@ -1475,7 +1536,7 @@ class PredefinedGeneratorBase:
         resolution = 1 / self.sample_rate * divisibility
         mod = value % resolution
         if mod < resolution / 2:
-            self.log.debug('Adjusted to sampling rate:' + str(value) + ' to ' + str(value - mod))
+            self.log.debug('Adjusted to sampling rate: %s to %s', value, value - mod)
             value = value - mod
         else:
             value = value + resolution - mod
@@ -1556,8 +1617,9 @@ class PulseObjectGenerator(PredefinedGeneratorBase):
             # Get all python modules to import from.
             # The assumption is that in the path, there are *.py files,
             # which contain only generator classes!
-            module_list = [name[:-3] for name in os.listdir(path) if
-                           os.path.isfile(os.path.join(path, name)) and name.endswith('.py')]
+            with os.scandir(path) as entries:
+                module_list = [entry.name[:-3] for entry in entries if
+                               entry.name.endswith('.py') and entry.is_file()]
 
             # append import path to sys.path
             if path not in sys.path:
@@ -89,6 +89,8 @@ class DDMethods(Enum):
 
     def __init__(self, phases):
         self._phases = phases
+        # members are constant, so build the phase array only once
+        self._phases_array = np.array(phases)
 
     @property
     def suborder(self):
@@ -96,7 +98,7 @@ class DDMethods(Enum):
 
     @property
     def phases(self):
-        return np.array(self._phases)
+        return self._phases_array.copy()
 
 class SamplingBase:
     """
@@ -158,8 +160,9 @@ class SamplingFunctions:
             if not os.path.exists(path):
                 continue
             # Get all python modules to import from.
-            module_list = [name[:-3] for name in os.listdir(path) if
-                           os.path.isfile(os.path.join(path, name)) and name.endswith('.py')]
+            with os.scandir(path) as entries:
+                module_list = [entry.name[:-3] for entry in entries if
+                               entry.name.endswith('.py') and entry.is_file()]
 
             # append import path to sys.path
             if path not in sys.path:
@@ -1125,8 +1125,8 @@ class SequenceGeneratorLogic(GenericLogic):
         for param in thrown_out_params:
             del kwargs_dict[param]
         if thrown_out_params:
-            self.log.debug('Unused params during predefined sequence generation "{0}":\n'
-                           '{1}'.format(predefined_sequence_name, thrown_out_params))
+            self.log.debug('Unused params during predefined sequence generation "%s":\n%s',
+                           predefined_sequence_name, thrown_out_params)
 
         try:
             blocks, ensembles, sequences = gen_method(**kwargs_dict)
@@ -1147,8 +1147,8 @@ class SequenceGeneratorLogic(GenericLogic):
             self.log.info('Adding default sequence for: {0:s}'.format(predefined_sequence_name))
             self._add_default_sequence(ensembles, sequences)
             if len(sequences) > 0:
-                self.log.debug('New default PulseSequence is: {0:s} length {1:d}'
-                               ''.format(sequences[0].name, len(sequences)))
+                self.log.debug('New default PulseSequence is: %s length %d',
+                               sequences[0].name, len(sequences))
 
         for sequence in sequences:
             sequence.sampling_information = dict()
@@ -1728,8 +1728,9 @@ class SequenceGeneratorLogic(GenericLogic):
         # Make sure the length of the channel is a multiple of the step size.
         # This is done by appending an idle block
         granularity = self.pulse_generator_constraints.waveform_length.step
-        self.log.debug('length: {0}, mod {1}'.format(
-            ensemble_info['number_of_samples'], ensemble_info['number_of_samples'] % granularity))
+        self.log.debug('length: %s, mod %s',
+                       ensemble_info['number_of_samples'],
+                       ensemble_info['number_of_samples'] % granularity)
         if ensemble_info['number_of_samples'] % granularity != 0:
             self.log.warn('Length {0} does not fulfil step constraint {1}.'.format(
                 ensemble_info['number_of_samples'], granularity))